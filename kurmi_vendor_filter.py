@@ -5,12 +5,14 @@ Scans kurmi_workspace_extraction folder and allows selective removal of vendor f
 """
 
 import os
+import re
 import sys
-import shutil
+import json
 import logging
 from pathlib import Path
-from typing import Dict, Set, List
-from collections import defaultdict
+from typing import Dict, FrozenSet, Set, Tuple
+from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configure logging
 logging.basicConfig(
@@ -32,37 +34,60 @@ class VendorFilter:
         'cisco': {
             'name': 'Cisco',
             'description': 'Cisco on-premises infrastructure vendors',
-            'vendors': {
+            'vendors': frozenset({
                 'Allocations', 'Cisco', 'Directory', 'ForgottenPassword',
                 'Technical', 'User', 'WrongAttempt', 'common', 'licensing'
-            }
+            })
         },
         'microsoft': {
             'name': 'Microsoft',
             'description': 'Microsoft cloud and collaboration vendors',
-            'vendors': {
+            'vendors': frozenset({
                 'Microsoft', 'm365', 'office365', 'office365graph'
-            }
+            })
         },
         'webex': {
             'name': 'Webex',
             'description': 'Cisco Webex collaboration and contact center vendors',
-            'vendors': {
+            'vendors': frozenset({
                 'webex', 'webexContactCenter', 'webexcontactcenter'
-            }
+            })
         }
     }
 
-    def __init__(self, extraction_dir: str = "kurmi_workspace_extraction"):
+    # Preset keys accepted at the selection prompt
+    _PRESET_KEYS = frozenset(VENDOR_PRESETS)
+
+    # Categories excluded from vendor scanning and removal
+    SKIP_CATEGORIES = frozenset({'scenarios'})
+
+    # Scan cache file kept inside the extraction directory
+    SCAN_CACHE_FILENAME = '.vendor_scan_cache.json'
+    SCAN_CACHE_VERSION = 1
+
+    # Vendors shown per page in the interactive selection menu
+    MENU_PAGE_SIZE = 40
+
+    # Number/range selection input, e.g. "1,3,5" or "1-3"
+    _SELECTION_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+    _SELECTION_INPUT_RE = re.compile(r'\s*\d+(?:\s*-\s*\d+)?\s*(?:,\s*\d+(?:\s*-\s*\d+)?\s*)*')
+
+    def __init__(self, extraction_dir: str = "kurmi_workspace_extraction", use_cache: bool = True):
         """
         Initialize the vendor filter.
 
         Args:
             extraction_dir: Path to the extracted workspace directory
+            use_cache: Reuse a previous scan result if the tree is unchanged
         """
         self.extraction_dir = Path(extraction_dir)
-        self.vendors_by_category = defaultdict(set)
-        self.all_vendors = set()
+        # Plain string form for os-level calls in hot paths (no PurePath overhead)
+        self._extraction_str = os.fspath(self.extraction_dir)
+        self.scan_cache_path = self.extraction_dir / self.SCAN_CACHE_FILENAME
+        self.use_cache = use_cache
+        self.vendors_by_category = {}
+        self.all_vendors = frozenset()
+        self.vendor_to_category_count = Counter()
 
         # Validate extraction directory exists
         if not self.extraction_dir.exists():
@@ -70,66 +95,215 @@ class VendorFilter:
 
         logger.info(f"Initialized vendor filter for: {self.extraction_dir}")
 
-    def scan_vendors(self) -> Dict[str, Set[str]]:
+    def scan_vendors(self) -> Dict[str, FrozenSet[str]]:
         """
         Scan all categories and identify vendors in each.
 
         Returns:
             Dictionary mapping category names to sets of vendor names
         """
+        if self.use_cache and self._load_scan_cache():
+            logger.info(f"Loaded vendor scan from cache: {self.scan_cache_path}")
+            logger.info(f"Found {len(self.all_vendors)} unique vendors across {len(self.vendors_by_category)} categories")
+            return dict(self.vendors_by_category)
+
         logger.info("Scanning for vendors in each category...")
 
-        # Categories to skip during vendor scanning
-        SKIP_CATEGORIES = {'scenarios'}
+        if self.use_cache:
+            # Create the cache file before recording the directory mtime,
+            # since creating it changes the mtime of the extraction directory
+            try:
+                self.scan_cache_path.touch(exist_ok=True)
+            except OSError:
+                pass  # reported when saving
+
+        # Record mtimes before reading each directory, so anything created
+        # while scanning leaves the cache stale rather than silently missing
+        mtime_ns = os.stat(self._extraction_str).st_mtime_ns
+
+        # Use os.scandir so is_dir() reuses the d_type from readdir instead of
+        # issuing an extra stat() per entry; skipped categories are filtered out here
+        with os.scandir(self._extraction_str) as categories:
+            category_entries = [
+                (entry.name, entry.path) for entry in categories
+                if entry.is_dir(follow_symlinks=False) and entry.name not in self.SKIP_CATEGORIES
+            ]
+
+        # Scan categories concurrently so the readdir latency of each overlaps;
+        # results are merged on this thread so no locking is needed
+        vendors_by_category = {}
+        category_mtimes_ns = {}
+        if category_entries:
+            with ThreadPoolExecutor(max_workers=min(32, len(category_entries))) as executor:
+                results = executor.map(self._scan_category, category_entries)
+
+                for category_name, category_mtime_ns, vendor_names in results:
+                    category_mtimes_ns[category_name] = category_mtime_ns
+                    if vendor_names:
+                        vendors_by_category[category_name] = frozenset(vendor_names)
+
+        self._set_scan_results(vendors_by_category)
+
+        if self.use_cache:
+            self._save_scan_cache(mtime_ns, category_mtimes_ns)
+
+        logger.info(f"Found {len(self.all_vendors)} unique vendors across {len(self.vendors_by_category)} categories")
+        return dict(self.vendors_by_category)
+
+    def _set_scan_results(self, vendors_by_category: Dict[str, FrozenSet[str]]):
+        """
+        Store scan results and rebuild derived lookups.
 
-        # Get all category directories
-        category_dirs = [d for d in self.extraction_dir.iterdir() if d.is_dir()]
+        Args:
+            vendors_by_category: Dictionary mapping category names to vendor names
+        """
+        # Scan results are read-only from here on, so keep them frozen
+        self.vendors_by_category = vendors_by_category
+        self.all_vendors = frozenset().union(*vendors_by_category.values())
 
-        for category_dir in category_dirs:
-            category_name = category_dir.name
+        # Index how many categories each vendor appears in for O(1) lookups
+        self.vendor_to_category_count = Counter()
+        for vendor_names in self.vendors_by_category.values():
+            self.vendor_to_category_count.update(vendor_names)
 
-            # Skip scenarios directory
-            if category_name in SKIP_CATEGORIES:
-                logger.info(f"Skipping category: {category_name} (excluded from vendor scanning)")
-                continue
+    def _load_scan_cache(self) -> bool:
+        """
+        Load a previous scan result if the extraction tree is unchanged.
 
-            logger.debug(f"Scanning category: {category_name}")
+        The cache is valid while the mtimes of the extraction directory and of
+        every scanned category directory match those recorded at scan time;
+        adding or removing a category or vendor directory changes them.
 
-            # Get all subdirectories (vendors) in this category
-            vendor_dirs = [d for d in category_dir.iterdir() if d.is_dir()]
+        Returns:
+            True if the cache was valid and loaded, False otherwise
+        """
+        try:
+            with open(self.scan_cache_path, 'r') as f:
+                cache = json.load(f)
+
+            if cache['version'] != self.SCAN_CACHE_VERSION:
+                return False
+            if os.stat(self._extraction_str).st_mtime_ns != cache['mtime_ns']:
+                return False
+            for category_name, mtime_ns in cache['category_mtimes_ns'].items():
+                if os.stat(os.path.join(self._extraction_str, category_name)).st_mtime_ns != mtime_ns:
+                    return False
+
+            vendors_by_category = {
+                category_name: frozenset(sys.intern(vendor) for vendor in vendors)
+                for category_name, vendors in cache['vendors_by_category'].items()
+            }
 
-            for vendor_dir in vendor_dirs:
-                vendor_name = vendor_dir.name
-                self.vendors_by_category[category_name].add(vendor_name)
-                self.all_vendors.add(vendor_name)
+            # Cached names are later joined into paths that get deleted, so
+            # only accept plain directory names
+            names = set(cache['category_mtimes_ns']).union(vendors_by_category, *vendors_by_category.values())
+            if not all(self._is_plain_name(name) for name in names):
+                return False
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing, stale or unreadable cache - fall back to a full scan
+            return False
 
-        logger.info(f"Found {len(self.all_vendors)} unique vendors across {len(self.vendors_by_category)} categories")
-        return dict(self.vendors_by_category)
+        self._set_scan_results(vendors_by_category)
+        return True
+
+    @staticmethod
+    def _is_plain_name(name) -> bool:
+        """
+        Check that a name refers to a single entry inside its parent directory.
+
+        Args:
+            name: Directory name to check
+
+        Returns:
+            True if name is a non-empty string without path separators that
+            is not '.' or '..'
+        """
+        return (
+            isinstance(name, str)
+            and name not in ('', os.curdir, os.pardir)
+            and os.sep not in name
+            and not (os.altsep and os.altsep in name)
+        )
+
+    def _save_scan_cache(self, mtime_ns: int, category_mtimes_ns: Dict[str, int]):
+        """
+        Persist the current scan result for reuse by later runs.
+
+        Args:
+            mtime_ns: Extraction directory mtime recorded before the scan
+            category_mtimes_ns: Category directory mtimes recorded before each was scanned
+        """
+        try:
+            cache = {
+                'version': self.SCAN_CACHE_VERSION,
+                'mtime_ns': mtime_ns,
+                'category_mtimes_ns': category_mtimes_ns,
+                'vendors_by_category': {
+                    category_name: sorted(vendors)
+                    for category_name, vendors in self.vendors_by_category.items()
+                }
+            }
+
+            # Overwrite in place so the directory mtime stays as recorded
+            with open(self.scan_cache_path, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"Could not write vendor scan cache {self.scan_cache_path}: {e}")
+
+    def invalidate_scan_cache(self):
+        """Delete the on-disk scan cache, if any."""
+        try:
+            self.scan_cache_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove vendor scan cache {self.scan_cache_path}: {e}")
+
+    @staticmethod
+    def _scan_category(category_entry: Tuple[str, str]) -> Tuple[str, int, Set[str]]:
+        """
+        Collect vendor directory names within a single category.
+
+        Args:
+            category_entry: Tuple of (category name, category directory path)
+
+        Returns:
+            Tuple of (category name, directory mtime before the scan, set of vendor names)
+        """
+        category_name, category_path = category_entry
+        logger.debug(f"Scanning category: {category_name}")
+
+        # Taken before reading the directory for the scan cache
+        mtime_ns = os.stat(category_path).st_mtime_ns
+
+        # Get all subdirectories (vendors) in this category
+        with os.scandir(category_path) as vendors:
+            # Intern names so later membership tests can short-circuit on identity
+            vendor_names = {sys.intern(entry.name) for entry in vendors if entry.is_dir(follow_symlinks=False)}
+
+        return category_name, mtime_ns, vendor_names
 
     def display_vendor_summary(self):
         """Display summary of vendors found in each category."""
         if not self.vendors_by_category:
             self.scan_vendors()
 
-        print("\n" + "=" * 80)
-        print("VENDOR DISTRIBUTION BY CATEGORY")
-        print("=" * 80)
-        print()
+        # Build the whole summary and emit it with a single write
+        lines = ["\n" + "=" * 80, "VENDOR DISTRIBUTION BY CATEGORY", "=" * 80, ""]
 
-        for category in sorted(self.vendors_by_category.keys()):
-            vendors = sorted(self.vendors_by_category[category])
-            print(f"{category}:")
-            print(f"  Vendors ({len(vendors)}): {', '.join(vendors)}")
-            print()
+        for category, vendors in sorted(self.vendors_by_category.items()):
+            lines.append(f"{category}:\n  Vendors ({len(vendors)}): {', '.join(sorted(vendors))}\n")
 
-        print("=" * 80)
-        print(f"ALL UNIQUE VENDORS ({len(self.all_vendors)}):")
-        print("=" * 80)
-        for vendor in sorted(self.all_vendors):
-            # Count in how many categories this vendor appears
-            category_count = sum(1 for vendors in self.vendors_by_category.values() if vendor in vendors)
-            print(f"  {vendor:<30} (in {category_count} categories)")
-        print()
+        lines.extend(["=" * 80, f"ALL UNIQUE VENDORS ({len(self.all_vendors)}):", "=" * 80])
+        # Show in how many categories each vendor appears
+        lines.extend(
+            f"  {vendor:<30} (in {self.vendor_to_category_count[vendor]} categories)"
+            for vendor in sorted(self.all_vendors)
+        )
+        lines.append("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def interactive_vendor_selection(self) -> Set[str]:
         """
@@ -142,90 +316,114 @@ class VendorFilter:
             self.scan_vendors()
 
         # Start with no vendors selected (user must explicitly choose which to keep)
-        selected = {vendor: False for vendor in sorted(self.all_vendors)}
+        selected = set()
         vendor_list = sorted(self.all_vendors)
 
-        while True:
-            print("\n" * 2)
-            print("=" * 80)
-            print("SELECT VENDORS TO KEEP (others will be removed)")
-            print("=" * 80)
-            print()
+        # Paginate long vendor lists so each redraw stays bounded
+        page_size = self.MENU_PAGE_SIZE
+        page_count = max(1, -(-len(vendor_list) // page_size))
+        page_idx = 0
+
+        # Static menu sections only need to be built once
+        header = "\n" * 3 + "=" * 80 + "\n" + "SELECT VENDORS TO KEEP (others will be removed)\n" + "=" * 80 + "\n\n"
+        footer_lines = [
+            "",
+            "=" * 80,
+            "Commands:",
+            "  - Enter numbers to toggle (e.g., 1,3,5 or 1-3)",
+            "  - Type 'all' to select all vendors",
+            "  - Type 'none' to deselect all vendors",
+        ]
+        if page_count > 1:
+            footer_lines.append("  - Type 'n' / 'p' for next / previous page")
+        footer_lines.extend([
+            "",
+            "Presets:",
+        ])
+        for preset_key, preset_info in self.VENDOR_PRESETS.items():
+            # Display preset key as-is
+            footer_lines.append(f"  - Type '{preset_key}' for {preset_info['name']} ({preset_info['description']})")
+        footer_lines.extend([
+            "",
+            "  - Press Enter or type 'done' to continue",
+            "  - Type 'q' to quit without changes",
+            "=" * 80,
+        ])
+        footer = "\n".join(footer_lines) + "\n"
 
-            # Display vendors with selection state
-            for idx, vendor in enumerate(vendor_list, 1):
-                checkbox = "[x]" if selected[vendor] else "[ ]"
+        while True:
+            # Build the whole screen and emit it with a single write
+            out = [header]
+
+            # Display vendors on the current page with selection state
+            page_start = page_idx * page_size
+            page_vendors = vendor_list[page_start:page_start + page_size]
+            for idx, vendor in enumerate(page_vendors, page_start + 1):
+                checkbox = "[x]" if vendor in selected else "[ ]"
                 # Count categories
-                category_count = sum(1 for vendors in self.vendors_by_category.values() if vendor in vendors)
-                print(f"  {idx:2d}. {checkbox} {vendor:<30} (in {category_count} categories)")
+                category_count = self.vendor_to_category_count[vendor]
+                out.append(f"  {idx:2d}. {checkbox} {vendor:<30} (in {category_count} categories)\n")
 
-            print()
-            print("=" * 80)
-            print("Commands:")
-            print("  - Enter numbers to toggle (e.g., 1,3,5 or 1-3)")
-            print("  - Type 'all' to select all vendors")
-            print("  - Type 'none' to deselect all vendors")
-            print()
-            print("Presets:")
-            for preset_key, preset_info in self.VENDOR_PRESETS.items():
-                # Display preset key as-is
-                display_key = preset_key
-                print(f"  - Type '{display_key}' for {preset_info['name']} ({preset_info['description']})")
-            print()
-            print("  - Press Enter or type 'done' to continue")
-            print("  - Type 'q' to quit without changes")
-            print("=" * 80)
+            if page_count > 1:
+                out.append(
+                    f"\n  Page {page_idx + 1}/{page_count} "
+                    f"(vendors {page_start + 1}-{page_start + len(page_vendors)} of {len(vendor_list)}, "
+                    f"{len(selected)} selected)\n"
+                )
+
+            out.append(footer)
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
 
             user_input = input("\nYour choice: ").strip().lower()
+            preset_key = user_input.replace(' ', '')
 
             if user_input in ['q', 'quit']:
                 logger.info("User cancelled vendor selection")
                 return None
             elif user_input in ['', 'done']:
                 break
+            elif user_input == 'n' and page_count > 1:
+                page_idx = min(page_idx + 1, page_count - 1)
+            elif user_input == 'p' and page_count > 1:
+                page_idx = max(page_idx - 1, 0)
             elif user_input == 'all':
-                selected = {vendor: True for vendor in vendor_list}
+                selected = set(vendor_list)
             elif user_input == 'none':
-                selected = {vendor: False for vendor in vendor_list}
-            elif user_input.replace(' ', '') in self.VENDOR_PRESETS:
+                selected.clear()
+            elif preset_key in self._PRESET_KEYS:
                 # Apply preset (additive - adds to current selection)
-                preset_key = user_input.replace(' ', '')
                 preset = self.VENDOR_PRESETS[preset_key]
-                preset_vendors = preset['vendors']
-                # Add preset vendors to current selection (additive)
-                for vendor in vendor_list:
-                    if vendor in preset_vendors:
-                        selected[vendor] = True
+                # Only preset vendors actually present in the workspace can be selected
+                matched_vendors = preset['vendors'] & self.all_vendors
+                selected |= matched_vendors
                 print(f"\nApplied preset: {preset['name']}")
-                matched = sum(1 for v in vendor_list if v in preset_vendors)
-                print(f"Added {matched} vendors from preset")
-                total_selected = sum(1 for v in selected.values() if v)
-                print(f"Total vendors selected: {total_selected}")
+                print(f"Added {len(matched_vendors)} vendors from preset")
+                print(f"Total vendors selected: {len(selected)}")
             else:
-                # Parse number input
-                try:
-                    numbers = []
-                    for part in user_input.split(','):
-                        part = part.strip()
-                        if '-' in part:
-                            # Range like 1-3
-                            start, end = map(int, part.split('-'))
-                            numbers.extend(range(start, end + 1))
-                        else:
-                            numbers.append(int(part))
-
-                    # Toggle selected vendors
-                    for num in numbers:
-                        if 1 <= num <= len(vendor_list):
-                            vendor = vendor_list[num - 1]
-                            selected[vendor] = not selected[vendor]
-                        else:
-                            print(f"Warning: Number {num} is out of range")
-                except ValueError:
+                # Parse number input (e.g. "1,3,5" or "1-3")
+                if not self._SELECTION_INPUT_RE.fullmatch(user_input):
                     print("Invalid input. Please enter numbers, ranges (1-3), or commands (all/none/done)")
+                    continue
+
+                # Collect into a set so repeated numbers toggle only once
+                numbers = set()
+                for match in self._SELECTION_RANGE_RE.finditer(user_input):
+                    start = int(match.group(1))
+                    end = int(match.group(2)) if match.group(2) else start
+                    numbers.update(range(start, end + 1))
+
+                # Toggle selected vendors
+                toggled = set()
+                for num in sorted(numbers):
+                    if 1 <= num <= len(vendor_list):
+                        toggled.add(vendor_list[num - 1])
+                    else:
+                        print(f"Warning: Number {num} is out of range")
+                selected ^= toggled
 
         # Get selected vendors
-        selected_vendors = {vendor for vendor, is_selected in selected.items() if is_selected}
+        selected_vendors = selected
 
         if not selected_vendors:
             print("\nWarning: No vendors selected. All vendor files will be removed!")
@@ -261,41 +459,50 @@ class VendorFilter:
         """
         logger.info(f"Starting vendor removal (keeping {len(vendors_to_keep)} vendors)...")
 
-        # Categories to skip during vendor removal
-        SKIP_CATEGORIES = {'scenarios'}
+        # Reuse the scan results instead of walking the tree a second time;
+        # SKIP_CATEGORIES are already excluded by the scan
+        if not self.vendors_by_category:
+            self.scan_vendors()
 
         removal_stats = defaultdict(int)
         total_removed = 0
-
-        # Iterate through each category
-        for category_dir in self.extraction_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
-
-            category_name = category_dir.name
-
-            # Skip scenarios directory
-            if category_name in SKIP_CATEGORIES:
-                logger.info(f"Skipping removal in category: {category_name} (excluded from vendor filtering)")
-                continue
-
-            # Iterate through vendor directories in this category
-            for vendor_dir in category_dir.iterdir():
-                if not vendor_dir.is_dir():
-                    continue
-
-                vendor_name = vendor_dir.name
-
-                # Remove if not in keep list
-                if vendor_name not in vendors_to_keep:
-                    logger.info(f"Removing: {category_name}/{vendor_name}")
+        to_remove = []
+
+        for category_name, vendors in self.vendors_by_category.items():
+            category_path = os.path.join(self._extraction_str, category_name)
+
+            # Queue vendors not in keep list for removal
+            for vendor_name in vendors - vendors_to_keep:
+                to_remove.append((category_name, vendor_name, os.path.join(category_path, vendor_name)))
+
+        # Remove vendor trees concurrently; each rmtree is a long run of
+        # unlink/rmdir syscalls that overlap well across unrelated trees.
+        # Results are reduced on this thread so removal_stats needs no lock.
+        if to_remove:
+            max_workers = min(32, (os.cpu_count() or 1) * 2, len(to_remove))
+            # Log the whole batch in one record rather than one write per vendor
+            removing = sorted(f"{category_name}/{vendor_name}" for category_name, vendor_name, _ in to_remove)
+            logger.info(f"Removing {len(removing)} vendor directories:\n  " + "\n  ".join(removing))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for category_name, vendor_name, vendor_dir in to_remove:
+                    futures[executor.submit(_fast_rmtree, vendor_dir)] = (category_name, vendor_dir)
+
+                for future in as_completed(futures):
+                    category_name, vendor_dir = futures[future]
                     try:
-                        shutil.rmtree(vendor_dir)
+                        future.result()
                         removal_stats[category_name] += 1
                         total_removed += 1
+                    except FileNotFoundError:
+                        logger.warning(f"Already removed: {vendor_dir}")
                     except Exception as e:
                         logger.error(f"Failed to remove {vendor_dir}: {e}")
 
+        # The tree has changed, so the next run must rescan
+        self.invalidate_scan_cache()
+
         # Display removal statistics
         logger.info("=" * 60)
         logger.info("VENDOR REMOVAL COMPLETE - STATISTICS")
@@ -309,6 +516,73 @@ class VendorFilter:
         logger.info("=" * 60)
 
 
+# Whether directories can be removed relative to an open directory fd
+# (openat/unlinkat), avoiding re-resolving the full path for every entry
+_RMTREE_USES_DIR_FD = (
+    {os.open, os.rmdir, os.unlink} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+
+def _fast_rmtree(path):
+    """
+    Recursively delete a directory tree.
+
+    Leaner than shutil.rmtree: one os.scandir pass per directory, reusing
+    the readdir d_type to tell subdirectories from files. Where supported,
+    entries are removed relative to an open directory fd. Symlinks are
+    unlinked, never followed. Errors (e.g. PermissionError) propagate to
+    the caller.
+
+    Args:
+        path: Directory to remove
+    """
+    if _RMTREE_USES_DIR_FD:
+        dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+        try:
+            _rmtree_dir_fd(dir_fd)
+        finally:
+            os.close(dir_fd)
+    else:
+        # List the directory and close the iterator before removing anything
+        # (see _rmtree_dir_fd)
+        with os.scandir(path) as scandir_it:
+            entries = [(entry.path, entry.is_dir(follow_symlinks=False)) for entry in scandir_it]
+
+        for entry_path, is_dir in entries:
+            if is_dir:
+                _fast_rmtree(entry_path)
+            else:
+                os.unlink(entry_path)
+    os.rmdir(path)
+
+
+def _rmtree_dir_fd(dir_fd):
+    """
+    Delete the contents of an open directory using fd-relative syscalls.
+
+    Args:
+        dir_fd: File descriptor of the directory to empty
+    """
+    # List the directory and close the iterator before removing anything:
+    # readdir results are unspecified once entries change mid-stream, and
+    # only one fd per recursion level stays open. is_dir() is resolved here
+    # since a d_type fallback stat needs the scandir fd
+    with os.scandir(dir_fd) as scandir_it:
+        entries = [(entry.name, entry.is_dir(follow_symlinks=False)) for entry in scandir_it]
+
+    for name, is_dir in entries:
+        if is_dir:
+            child_fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=dir_fd)
+            try:
+                _rmtree_dir_fd(child_fd)
+            finally:
+                os.close(child_fd)
+            os.rmdir(name, dir_fd=dir_fd)
+        else:
+            os.unlink(name, dir_fd=dir_fd)
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -324,6 +598,9 @@ Examples:
   # Specify custom extraction directory
   python kurmi_vendor_filter.py -d ./my_extraction
 
+  # Non-interactive: keep a preset plus extra vendors, remove the rest
+  python kurmi_vendor_filter.py --preset cisco --keep webex,m365
+
 The script will:
   1. Scan all categories in the extraction directory
   2. Identify all vendors in each category
@@ -346,6 +623,24 @@ CAUTION: This operation cannot be undone!
         help='Enable verbose logging'
     )
 
+    parser.add_argument(
+        '--rescan',
+        action='store_true',
+        help='Ignore any cached vendor scan and rescan the extraction directory'
+    )
+
+    parser.add_argument(
+        '--preset',
+        action='append',
+        choices=list(VendorFilter.VENDOR_PRESETS),
+        help='Keep vendors from this preset without prompting (repeatable, additive)'
+    )
+
+    parser.add_argument(
+        '--keep',
+        help='Comma-separated vendor names to keep without prompting (e.g., Cisco,webex)'
+    )
+
     args = parser.parse_args()
 
     # Set logging level
@@ -354,11 +649,37 @@ CAUTION: This operation cannot be undone!
 
     try:
         # Initialize vendor filter
-        vendor_filter = VendorFilter(extraction_dir=args.directory)
+        vendor_filter = VendorFilter(extraction_dir=args.directory, use_cache=not args.rescan)
 
         # Scan vendors
         vendor_filter.scan_vendors()
 
+        # Non-interactive mode: skip the summary and menus entirely
+        if args.preset or args.keep:
+            keep_names = {vendor.strip() for vendor in (args.keep or '').split(',') if vendor.strip()}
+            not_found = keep_names - vendor_filter.all_vendors
+            if not_found:
+                # Likely a typo - removing everything else would be irreversible
+                logger.error(f"Vendors not found in workspace: {', '.join(sorted(not_found))}")
+                logger.error("No vendors were removed")
+                return 1
+
+            vendors_to_keep = set(keep_names)
+            for preset_key in args.preset or []:
+                vendors_to_keep |= VendorFilter.VENDOR_PRESETS[preset_key]['vendors']
+
+            vendors_to_keep &= vendor_filter.all_vendors
+            if not vendors_to_keep:
+                # There is no confirmation prompt here, so never remove every vendor
+                logger.error("None of the selected vendors exist in the workspace")
+                logger.error("No vendors were removed")
+                return 1
+
+            vendor_filter.remove_vendors(vendors_to_keep)
+
+            logger.info("\nVendor filtering complete!")
+            return 0
+
         # Display summary
         vendor_filter.display_vendor_summary()
 
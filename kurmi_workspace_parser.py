@@ -7,12 +7,16 @@ Parses Kurmi workspace export files and organizes them into categorized folders.
 import os
 import sys
 import shutil
+import struct
+import zlib
 import zipfile
 import argparse
-import tempfile
 import logging
+import threading
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -69,6 +73,36 @@ class KurmiWorkspaceParser:
         }
     }
 
+    # CATEGORIES flattened once at class load into parallel, index-aligned
+    # tuples so setup and reporting avoid nested dict lookups
+    _CAT_NAMES = tuple(CATEGORIES)
+    _CAT_DESCRIPTIONS = tuple(info['description'] for info in CATEGORIES.values())
+    _CAT_SUFFIXES = tuple(
+        tuple(pattern[1:] for pattern in info['patterns'] if pattern.startswith('*'))
+        for info in CATEGORIES.values()
+    )
+    _CAT_INDEX = {name: idx for idx, name in enumerate(_CAT_NAMES)}
+
+    # Chunk size for streaming entries to disk. The 16 KiB shutil default
+    # spends most of its time in Python loop overhead on multi-MB scenario
+    # files; 1 MiB chunks also bypass the destination's write buffer, since
+    # BufferedWriter hands writes larger than its buffer straight to the OS
+    COPY_BUFFER_SIZE = 1 << 20
+
+    # Maximum number of memoized file name tails in get_category_for_file
+    CLASSIFY_CACHE_SIZE = 4096
+
+    # Zip local file header layout (see APPNOTE.TXT 4.3.7)
+    ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+    ZIP_LOCAL_HEADER_SIZE = 30
+    ZIP_FLAG_ENCRYPTED = 0x1
+    ZIP_FLAG_UTF8 = 0x800
+
+    # Central directory fields holding this value are stored in the zip64
+    # extra field (see APPNOTE.TXT 4.5.3)
+    ZIP64_FIELD_LIMIT = 0xFFFFFFFF
+    ZIP64_EXTRA_ID = 0x0001
+
     def __init__(self, workspace_zip: str, output_dir: str, categories: List[str] = None):
         """
         Initialize the parser.
@@ -80,32 +114,68 @@ class KurmiWorkspaceParser:
         """
         self.workspace_zip = Path(workspace_zip)
         self.output_dir = Path(output_dir)
+        # Plain string form for building per-file paths without PurePath overhead
+        self._output_dir_str = os.fspath(self.output_dir)
         self.categories_to_parse = categories if categories else list(self.CATEGORIES.keys())
-        self.temp_dir = None
+        # Output folder of each selected category, joined once up front
+        self._cat_out_dirs = {
+            category: os.path.join(self._output_dir_str, category)
+            for category in self.categories_to_parse
+        }
         self.stats = {category: 0 for category in self.categories_to_parse}
-
-        # Validate inputs
-        if not self.workspace_zip.exists():
-            raise FileNotFoundError(f"Workspace zip not found: {self.workspace_zip}")
+        self._zip_fd = None
+        # Per-thread ZipFile handles for entries the raw fd readers cannot
+        # handle (see _get_thread_zip)
+        self._thread_local = threading.local()
+        self._thread_zips = []
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # All patterns are right-anchored '*.suffix' globs, so precompute the
+        # suffixes once: a flat (suffix, category) list in category priority
+        # order plus a tuple of every suffix for a single C-level endswith()
+        self._selected_indices = tuple(self._CAT_INDEX[category] for category in self.categories_to_parse)
+        self._suffix_to_cat = [
+            (suffix, self._CAT_NAMES[idx])
+            for idx in self._selected_indices
+            for suffix in self._CAT_SUFFIXES[idx]
+        ]
+        self._all_suffixes = tuple(suffix for suffix, _ in self._suffix_to_cat)
+        self._classify = self._build_classifier(self._suffix_to_cat)
+
+        # Classification only depends on the last (longest suffix) characters
+        # of a name, so memoize on that tail; unique basenames still hit
+        self._max_suffix_len = max((len(suffix) for suffix in self._all_suffixes), default=0)
+        self._classify_cache = {}
 
         logger.info(f"Initialized parser for: {self.workspace_zip}")
         logger.info(f"Output directory: {self.output_dir}")
         logger.info(f"Categories to parse: {', '.join(self.categories_to_parse)}")
 
-    def extract_workspace(self) -> Path:
-        """Extract workspace zip to temporary directory."""
-        logger.info("Extracting workspace zip file...")
-        self.temp_dir = tempfile.mkdtemp(prefix='kurmi_workspace_')
-        temp_path = Path(self.temp_dir)
+    @staticmethod
+    def _build_classifier(suffix_to_cat: List[Tuple[str, str]]) -> Callable[[str], Optional[str]]:
+        """
+        Generate a classifier function specialized for the selected suffixes.
 
-        try:
-            with zipfile.ZipFile(self.workspace_zip, 'r') as zip_ref:
-                zip_ref.extractall(temp_path)
-            logger.info(f"Extracted to temporary directory: {temp_path}")
-            return temp_path
-        except Exception as e:
-            logger.error(f"Failed to extract workspace: {e}")
-            raise
+        The selection is fixed for the whole run, so the suffix checks are
+        emitted as a straight-line chain of endswith() tests, longest suffix
+        first so overlapping patterns (e.g. '.builtin.util.js' vs '.util.js')
+        resolve to the most specific one.
+
+        Args:
+            suffix_to_cat: (suffix, category) pairs in priority order
+
+        Returns:
+            Function mapping a file name to its category name or None
+        """
+        lines = ["def classify(name):"]
+        # Stable sort keeps priority order among equal-length suffixes
+        for suffix, category in sorted(suffix_to_cat, key=lambda item: -len(item[0])):
+            lines.append(f"    if name.endswith({suffix!r}): return {category!r}")
+        lines.append("    return None")
+
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        return namespace['classify']
 
     def matches_pattern(self, filename: str, patterns: List[str]) -> bool:
         """
@@ -138,68 +208,384 @@ class KurmiWorkspaceParser:
         Returns:
             Category name or None if file doesn't match any category
         """
-        for category in self.categories_to_parse:
-            patterns = self.CATEGORIES[category]['patterns']
-            if self.matches_pattern(filename, patterns):
-                return category
-        return None
+        key = filename[-self._max_suffix_len:]
+        try:
+            return self._classify_cache[key]
+        except KeyError:
+            pass
+
+        category = self._classify_suffix(key)
+        if len(self._classify_cache) < self.CLASSIFY_CACHE_SIZE:
+            self._classify_cache[key] = category
+        return category
 
-    def copy_file_preserving_structure(self, source_file: Path, base_dir: Path, category: str):
+    def _classify_suffix(self, filename: str) -> str:
         """
-        Copy file to category folder while preserving relative folder structure.
+        Classify a file name (or its tail) against the selected suffixes.
 
         Args:
-            source_file: Full path to source file
-            base_dir: Base directory (extracted workspace root)
+            filename: Name of the file, or at least its last characters
+
+        Returns:
+            Category name or None if no selected suffix matches
+        """
+        # Fast reject: most files match no selected category
+        if not filename.endswith(self._all_suffixes):
+            return None
+
+        return self._classify(filename)
+
+    @staticmethod
+    def safe_relative_path(member_name: str) -> str:
+        """
+        Convert a zip member name into a safe relative output path.
+
+        Mirrors the sanitizing done by ZipFile.extractall: drive letters,
+        absolute roots and '.'/'..' components are dropped so entries cannot
+        escape the output directory.
+
+        Args:
+            member_name: Name of the entry inside the zip archive
+
+        Returns:
+            Sanitized relative path (empty if nothing usable remains)
+        """
+        arcname = member_name.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        parts = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+        return os.path.sep.join(parts)
+
+    def extract_entry(self, entry: Tuple[str, int, int, int, int, int, int], relative_path: str, category: str):
+        """
+        Stream a single zip entry into its category folder, preserving the relative folder structure.
+
+        The destination's parent directory must already exist; parse_workspace
+        creates all needed directories up front.
+
+        Args:
+            entry: Central directory tuple from _read_central_directory
+            relative_path: Sanitized relative path of the entry
             category: Category name for output folder
         """
-        # Get relative path from base directory
-        relative_path = source_file.relative_to(base_dir)
+        name, _, _, _, compress_type, _, flag_bits = entry
 
         # Create destination path
-        dest_path = self.output_dir / category / relative_path
+        dest_path = os.path.join(self._cat_out_dirs[category], relative_path)
+
+        # Stored and deflated entries are read straight from the archive fd;
+        # anything else (encrypted, bzip2, lzma...) goes through zipfile
+        try:
+            copied = False
+            if self._zip_fd is not None and not flag_bits & self.ZIP_FLAG_ENCRYPTED:
+                if compress_type == zipfile.ZIP_STORED:
+                    copied = self._copy_stored_entry(entry, dest_path)
+                elif compress_type == zipfile.ZIP_DEFLATED:
+                    copied = self._inflate_entry(entry, dest_path)
+
+            if not copied:
+                # Stream entry straight to its destination (no temporary extraction)
+                with self._get_thread_zip().open(name) as src, open(dest_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=self.COPY_BUFFER_SIZE)
+        except BaseException:
+            # Never leave a truncated or corrupt file under its real name
+            try:
+                os.unlink(dest_path)
+            except OSError:
+                pass
+            raise
+        if self._debug_enabled:
+            logger.debug("Extracted: %s -> %s/", relative_path, category)
+
+    def _entry_data_offset(self, name: str, header_offset: int) -> Optional[int]:
+        """
+        Locate an entry's data from its local file header.
+
+        As with ZipFile.open, the local header's file name must match the
+        central directory name.
+
+        Args:
+            name: Entry name from the central directory
+            header_offset: Offset of the entry's local file header
+
+        Returns:
+            Offset of the entry's data, or None if the header is invalid
+        """
+        header = os.pread(self._zip_fd, self.ZIP_LOCAL_HEADER_SIZE, header_offset)
+        if len(header) != self.ZIP_LOCAL_HEADER_SIZE or header[:4] != self.ZIP_LOCAL_HEADER_SIGNATURE:
+            return None
 
-        # Create parent directories if they don't exist
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        flag_bits, = struct.unpack('<H', header[6:8])
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        local_name = os.pread(self._zip_fd, name_length, header_offset + self.ZIP_LOCAL_HEADER_SIZE)
+        try:
+            if local_name.decode('utf-8' if flag_bits & self.ZIP_FLAG_UTF8 else 'cp437') != name:
+                return None
+        except UnicodeDecodeError:
+            return None
 
-        # Copy file
-        shutil.copy2(source_file, dest_path)
-        logger.debug(f"Copied: {relative_path} -> {category}/")
+        # Data starts after the fixed header, file name and extra field
+        return header_offset + self.ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+
+    def _copy_stored_entry(self, entry: Tuple[str, int, int, int, int, int, int], dest_path: str) -> bool:
+        """
+        Copy an uncompressed (ZIP_STORED) entry straight from the archive fd.
+
+        Data is read with os.pread, so worker threads can share one fd
+        without a ZipFile each. The CRC is verified as with ZipFile.
+
+        Args:
+            entry: Central directory tuple of the stored entry
+            dest_path: Destination file path
+
+        Returns:
+            True if copied, False if the caller should fall back to zipfile
+
+        Raises:
+            zipfile.BadZipFile: If the copied data fails its CRC check
+        """
+        name, header_offset, compress_size, _, _, expected_crc, _ = entry
+        offset = self._entry_data_offset(name, header_offset)
+        if offset is None:
+            return False
+        remaining = compress_size
+
+        crc = 0
+        with open(dest_path, 'wb') as dst:
+            while remaining > 0:
+                data = os.pread(self._zip_fd, min(remaining, self.COPY_BUFFER_SIZE), offset)
+                if not data:
+                    # Archive ended early - let zipfile report the problem
+                    return False
+                offset += len(data)
+                remaining -= len(data)
+                crc = zlib.crc32(data, crc)
+                dst.write(data)
+
+        if crc != expected_crc:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+        return True
+
+    def _inflate_entry(self, entry: Tuple[str, int, int, int, int, int, int], dest_path: str) -> bool:
+        """
+        Decompress a ZIP_DEFLATED entry straight from the archive fd.
+
+        Compressed data is read with os.pread, so worker threads can share
+        one fd without a ZipFile each. The CRC is verified as with ZipFile.
+
+        Args:
+            entry: Central directory tuple of the deflated entry
+            dest_path: Destination file path
+
+        Returns:
+            True if extracted, False if the caller should fall back to zipfile
+
+        Raises:
+            zipfile.BadZipFile: If the extracted data fails its CRC check
+        """
+        name, header_offset, compress_size, _, _, expected_crc, _ = entry
+        offset = self._entry_data_offset(name, header_offset)
+        if offset is None:
+            return False
+        remaining = compress_size
+
+        buffer_size = self.COPY_BUFFER_SIZE
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        crc = 0
+        with open(dest_path, 'wb') as dst:
+            while remaining > 0:
+                chunk = os.pread(self._zip_fd, min(remaining, buffer_size), offset)
+                if not chunk:
+                    # Archive ended early - let zipfile report the problem
+                    return False
+                offset += len(chunk)
+                remaining -= len(chunk)
+                # Bound each output block so highly compressed entries do
+                # not inflate a whole chunk into memory at once
+                while chunk:
+                    data = decompressor.decompress(chunk, buffer_size)
+                    crc = zlib.crc32(data, crc)
+                    dst.write(data)
+                    chunk = decompressor.unconsumed_tail
+            data = decompressor.flush()
+            crc = zlib.crc32(data, crc)
+            dst.write(data)
+
+        if crc != expected_crc:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+        return True
+
+    def _read_central_directory(self, zip_file) -> List[Tuple[str, int, int, int, int, int, int]]:
+        """
+        Read the zip central directory, keeping only candidate entries.
+
+        Records are parsed in place from the raw central directory and names
+        are checked against the selected suffixes as bytes, so rejected
+        entries never get a decoded name or a ZipInfo.
+
+        Args:
+            zip_file: Workspace zip opened in binary mode
+
+        Returns:
+            List of (name, local header offset, compressed size, size,
+            compression method, CRC-32, flag bits) tuples
+
+        Raises:
+            zipfile.BadZipFile: If the archive is not a readable zip file
+        """
+        endrec = zipfile._EndRecData(zip_file)
+        if not endrec:
+            raise zipfile.BadZipFile("File is not a zip file")
+        if endrec[zipfile._ECD_DISK_NUMBER] > 1:
+            raise zipfile.BadZipFile("zipfiles that span multiple disks are not supported")
+
+        # Offsets are relative to the start of the zip data, which may be
+        # preceded by other data (e.g. a self-extractor stub)
+        size_cd = endrec[zipfile._ECD_SIZE]
+        offset_cd = endrec[zipfile._ECD_OFFSET]
+        concat = endrec[zipfile._ECD_LOCATION] - size_cd - offset_cd
+        if endrec[zipfile._ECD_SIGNATURE] == zipfile.stringEndArchive64:
+            concat -= zipfile.sizeEndCentDir64 + zipfile.sizeEndCentDir64Locator
+
+        zip_file.seek(offset_cd + concat)
+        data = zip_file.read(size_cd)
+
+        # Suffixes are ASCII, which encodes the same in cp437 and UTF-8
+        suffixes = tuple(suffix.encode('ascii') for suffix in self._all_suffixes)
+        record_size = zipfile.sizeCentralDir
+        unpack_record = struct.Struct(zipfile.structCentralDir).unpack_from
+        entries = []
+        pos = 0
+        while pos + record_size <= size_cd:
+            (signature, _, _, _, _, flag_bits, compress_type, _, _, crc, compress_size, file_size,
+             name_length, extra_length, comment_length, _, _, _, header_offset) = unpack_record(data, pos)
+            if signature != zipfile.stringCentralDir:
+                raise zipfile.BadZipFile("Bad magic number for central directory")
+            name_start = pos + record_size
+            extra_start = name_start + name_length
+            pos = extra_start + extra_length + comment_length
+
+            # Fast reject on the raw member name: patterns are pure suffixes
+            # without '/', so no basename is needed (this also rejects
+            # directory entries, which end in '/')
+            raw_name = data[name_start:extra_start]
+            if not raw_name.endswith(suffixes):
+                continue
+
+            if self.ZIP64_FIELD_LIMIT in (file_size, compress_size, header_offset):
+                file_size, compress_size, header_offset = self._read_zip64_extra(
+                    data[extra_start:extra_start + extra_length], file_size, compress_size, header_offset)
+
+            name = raw_name.decode('utf-8' if flag_bits & self.ZIP_FLAG_UTF8 else 'cp437')
+            entries.append((name, header_offset + concat, compress_size, file_size, compress_type, crc, flag_bits))
+        return entries
+
+    def _read_zip64_extra(self, extra: bytes, file_size: int, compress_size: int, header_offset: int) -> Tuple[int, int, int]:
+        """
+        Replace overflowed central directory fields with their zip64 values.
+
+        Args:
+            extra: Extra field data of the central directory record
+            file_size: Uncompressed size from the record
+            compress_size: Compressed size from the record
+            header_offset: Local header offset from the record
+
+        Returns:
+            Tuple of (file_size, compress_size, header_offset)
+
+        Raises:
+            zipfile.BadZipFile: If the zip64 extra field is missing or corrupt
+        """
+        pos = 0
+        while pos + 4 <= len(extra):
+            field_id, field_length = struct.unpack_from('<HH', extra, pos)
+            pos += 4
+            if field_length > len(extra) - pos:
+                raise zipfile.BadZipFile(f"Corrupt extra field {field_id:04x} (size={field_length})")
+            if field_id == self.ZIP64_EXTRA_ID:
+                # Only the overflowed fields are present, in this fixed order
+                values = list(struct.unpack_from('<%dQ' % (field_length // 8), extra, pos))
+                try:
+                    if file_size == self.ZIP64_FIELD_LIMIT:
+                        file_size = values.pop(0)
+                    if compress_size == self.ZIP64_FIELD_LIMIT:
+                        compress_size = values.pop(0)
+                    if header_offset == self.ZIP64_FIELD_LIMIT:
+                        header_offset = values.pop(0)
+                except IndexError:
+                    raise zipfile.BadZipFile("Corrupt extra field 0001 (zip64)")
+                return file_size, compress_size, header_offset
+            pos += field_length
+        raise zipfile.BadZipFile("Missing zip64 extra field")
+
+    def _get_thread_zip(self) -> zipfile.ZipFile:
+        """
+        Return this thread's own ZipFile handle on the workspace zip.
+
+        Only needed for entries the raw fd readers cannot handle, so the
+        handle (and its full central directory parse) is opened lazily.
+        ZipFile objects are not safe to share between threads, so each
+        thread opens (and reuses) a private handle.
+
+        Returns:
+            Open ZipFile for the current thread
+        """
+        zip_ref = getattr(self._thread_local, 'zip_ref', None)
+        if zip_ref is None:
+            zip_ref = zipfile.ZipFile(self.workspace_zip, 'r')
+            self._thread_local.zip_ref = zip_ref
+            self._thread_zips.append(zip_ref)
+        return zip_ref
+
+    def _extract_entry_worker(self, entry: Tuple[Tuple, str, str]) -> str:
+        """
+        Extract one matched entry on a worker thread.
+
+        Args:
+            entry: Tuple of (central directory tuple, sanitized relative path, category)
+
+        Returns:
+            Category of the extracted entry
+        """
+        zip_entry, relative_path, category = entry
+        self.extract_entry(zip_entry, relative_path, category)
+        return category
 
     def parse_workspace(self):
         """Main parsing logic."""
         try:
-            # Extract workspace
-            extracted_path = self.extract_workspace()
+            # Check the log level once rather than per extracted file
+            self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
             # Create output directory
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Walk through all files in extracted workspace
+            # Classify entries straight from the zip's central directory;
+            # only matching ones are extracted
             logger.info("Starting file categorization...")
-            for root, dirs, files in os.walk(extracted_path):
-                for filename in files:
-                    # Skip workspace.txt
-                    if filename == 'workspace.txt':
-                        continue
-
-                    # Determine category
-                    category = self.get_category_for_file(filename)
-
-                    if category:
-                        source_file = Path(root) / filename
-                        self.copy_file_preserving_structure(source_file, extracted_path, category)
-                        self.stats[category] += 1
+            # Keep one handle on the archive for the whole run: the central
+            # directory is read from it and entries are extracted from its fd
+            with open(self.workspace_zip, 'rb') as zip_file:
+                candidates = self._read_central_directory(zip_file)
+
+                # Nothing can match the selected categories - skip straight to
+                # the (empty) statistics
+                if not candidates:
+                    logger.warning("No files in the workspace match the selected categories")
+                else:
+                    self._extract_candidates(zip_file, candidates)
 
             # Log statistics
             logger.info("=" * 60)
             logger.info("PARSING COMPLETE - STATISTICS")
             logger.info("=" * 60)
             total_files = 0
-            for category in self.categories_to_parse:
+            for idx in self._selected_indices:
+                category = self._CAT_NAMES[idx]
                 count = self.stats[category]
                 total_files += count
-                description = self.CATEGORIES[category]['description']
+                description = self._CAT_DESCRIPTIONS[idx]
                 logger.info(f"{category:25s}: {count:4d} files - {description}")
             logger.info("=" * 60)
             logger.info(f"{'TOTAL':25s}: {total_files:4d} files")
@@ -208,11 +594,81 @@ class KurmiWorkspaceParser:
         except Exception as e:
             logger.error(f"Error during parsing: {e}")
             raise
+
+    def _extract_candidates(self, zip_file, candidates: List[Tuple[str, int, int, int, int, int, int]]):
+        """
+        Classify candidate entries and extract the matching ones.
+
+        Args:
+            zip_file: Workspace zip opened in binary mode by parse_workspace
+            candidates: Central directory tuples from _read_central_directory
+        """
+        matched_entries = {}
+        needed_dirs = set()
+        for zip_entry in candidates:
+            name = zip_entry[0]
+
+            # Skip workspace.txt
+            if name == 'workspace.txt' or name.endswith('/workspace.txt'):
+                continue
+
+            # Determine category
+            category = self.get_category_for_file(name)
+            if not category:
+                continue
+
+            relative_path = self.safe_relative_path(name)
+            if not relative_path:
+                continue
+
+            # Later duplicates of a path replace earlier ones, as
+            # with sequential extraction
+            matched_entries[(category, relative_path)] = (zip_entry, relative_path, category)
+            needed_dirs.add(os.path.dirname(os.path.join(self._cat_out_dirs[category], relative_path)))
+
+        # Create each distinct destination directory once, shallowest
+        # first, instead of a mkdir per extracted file (this also avoids
+        # mkdir races between extraction workers)
+        for dest_dir in sorted(needed_dirs, key=lambda d: d.count(os.path.sep)):
+            os.makedirs(dest_dir, exist_ok=True)
+
+        if matched_entries:
+            self._extract_matched_entries(zip_file, list(matched_entries.values()))
+
+    def _extract_matched_entries(self, zip_file, entries: List[Tuple[Tuple, str, str]]):
+        """
+        Extract classified entries and add them to the statistics.
+
+        Entries are extracted concurrently (decompression and file writes
+        release the GIL) through one shared fd read with explicit offsets;
+        with a single worker they are extracted on this thread. Stats are
+        reduced on this thread.
+
+        Args:
+            zip_file: Workspace zip opened in binary mode by parse_workspace
+            entries: Tuples of (central directory tuple, sanitized relative path, category)
+        """
+        # Shared raw fd; reads use explicit offsets, so workers never move a
+        # shared file position (without os.pread everything uses zipfile)
+        if hasattr(os, 'pread'):
+            self._zip_fd = zip_file.fileno()
+        max_workers = min(32, os.cpu_count() or 1, len(entries))
+        try:
+            if max_workers == 1:
+                extracted_counts = Counter(map(self._extract_entry_worker, entries))
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # Count in one C-level pass, then fold into self.stats
+                    extracted_counts = Counter(executor.map(self._extract_entry_worker, entries))
+            for category, count in extracted_counts.items():
+                self.stats[category] += count
         finally:
-            # Clean up temporary directory
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                logger.info(f"Cleaning up temporary directory: {self.temp_dir}")
-                shutil.rmtree(self.temp_dir)
+            for thread_zip in self._thread_zips:
+                thread_zip.close()
+            self._thread_local = threading.local()
+            self._thread_zips = []
+            # The fd belongs to parse_workspace's file object
+            self._zip_fd = None
 
     def get_stats(self) -> Dict[str, int]:
         """Return parsing statistics."""
@@ -227,24 +683,26 @@ def scan_for_workspace_files(directory="."):
         directory: Directory to scan (default: current directory)
 
     Returns:
-        List of workspace file paths
+        List of (workspace file path, os.stat_result) tuples, newest first
     """
-    import glob
-
-    # Look for .configfile.zip files
-    pattern = os.path.join(directory, "*.configfile.zip")
-    workspace_files = glob.glob(pattern)
-
-    # Also check in workspaceExport subdirectory if it exists
-    workspace_export_dir = os.path.join(directory, "workspaceExport")
-    if os.path.exists(workspace_export_dir):
-        pattern = os.path.join(workspace_export_dir, "*.configfile.zip")
-        workspace_files.extend(glob.glob(pattern))
+    workspace_entries = []
+
+    # Look for .configfile.zip files in the directory and in its
+    # workspaceExport subdirectory (if it exists); one scandir pass each,
+    # with the stat taken from the directory entry
+    for scan_dir in (directory, os.path.join(directory, "workspaceExport")):
+        if not os.path.isdir(scan_dir):
+            continue
+        with os.scandir(scan_dir) as entries:
+            for entry in entries:
+                # Hidden files are skipped, as glob's '*' did
+                if entry.name.endswith('.configfile.zip') and not entry.name.startswith('.') and entry.is_file():
+                    workspace_entries.append((entry.path, entry.stat()))
 
     # Sort by modification time (newest first)
-    workspace_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+    workspace_entries.sort(key=lambda entry: entry[1].st_mtime, reverse=True)
 
-    return workspace_files
+    return workspace_entries
 
 
 def interactive_workspace_selection(workspace_files):
@@ -252,7 +710,7 @@ def interactive_workspace_selection(workspace_files):
     Interactive workspace file selection menu.
 
     Args:
-        workspace_files: List of workspace file paths
+        workspace_files: List of (workspace file path, os.stat_result) tuples
 
     Returns:
         Selected workspace file path or None
@@ -274,13 +732,13 @@ def interactive_workspace_selection(workspace_files):
         print()
 
         # Display workspace files
-        for idx, filepath in enumerate(workspace_files, 1):
+        for idx, (filepath, file_stat) in enumerate(workspace_files, 1):
             filename = os.path.basename(filepath)
             # Get file size
-            size_mb = os.path.getsize(filepath) / (1024 * 1024)
+            size_mb = file_stat.st_size / (1024 * 1024)
             # Get modification time
             import time
-            mtime = time.strftime('%Y-%m-%d %H:%M', time.localtime(os.path.getmtime(filepath)))
+            mtime = time.strftime('%Y-%m-%d %H:%M', time.localtime(file_stat.st_mtime))
             print(f"  {idx}. {filename}")
             print(f"     Size: {size_mb:.2f} MB | Modified: {mtime}")
             print()
@@ -297,7 +755,7 @@ def interactive_workspace_selection(workspace_files):
         try:
             choice = int(user_input)
             if 1 <= choice <= len(workspace_files):
-                selected_file = workspace_files[choice - 1]
+                selected_file = workspace_files[choice - 1][0]
                 print(f"\nSelected: {os.path.basename(selected_file)}")
                 return selected_file
             else:
@@ -316,8 +774,11 @@ def interactive_category_selection(available_categories):
     Returns:
         List of selected category names
     """
-    # Start with all categories selected
-    selected = {cat: True for cat in available_categories.keys()}
+    category_list = list(available_categories.keys())
+    category_count = len(category_list)
+
+    # Selection state as a 0/1 byte per category; start with all selected
+    selected = bytearray(b'\x01' * category_count)
 
     while True:
         # Clear screen (optional - comment out if not desired)
@@ -329,9 +790,8 @@ def interactive_category_selection(available_categories):
         print()
 
         # Display categories with selection state
-        category_list = list(available_categories.keys())
         for idx, category in enumerate(category_list, 1):
-            checkbox = "[x]" if selected[category] else "[ ]"
+            checkbox = "[x]" if selected[idx - 1] else "[ ]"
             desc = available_categories[category]['description']
             print(f"  {idx}. {checkbox} {category:25s} - {desc}")
 
@@ -349,9 +809,9 @@ def interactive_category_selection(available_categories):
         if user_input in ['', 'done']:
             break
         elif user_input == 'all':
-            selected = {cat: True for cat in available_categories.keys()}
+            selected[:] = b'\x01' * category_count
         elif user_input == 'none':
-            selected = {cat: False for cat in available_categories.keys()}
+            selected[:] = bytes(category_count)
         else:
             # Parse number input
             try:
@@ -367,16 +827,15 @@ def interactive_category_selection(available_categories):
 
                 # Toggle selected categories
                 for num in numbers:
-                    if 1 <= num <= len(category_list):
-                        category = category_list[num - 1]
-                        selected[category] = not selected[category]
+                    if 1 <= num <= category_count:
+                        selected[num - 1] ^= 1
                     else:
                         print(f"Warning: Number {num} is out of range")
             except ValueError:
                 print("Invalid input. Please enter numbers, ranges (1-3), or commands (all/none/done)")
 
     # Return list of selected categories
-    selected_categories = [cat for cat, is_selected in selected.items() if is_selected]
+    selected_categories = [category_list[i] for i in range(category_count) if selected[i]]
 
     if not selected_categories:
         print("\nWarning: No categories selected. Exiting.")